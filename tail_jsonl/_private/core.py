@@ -1,47 +1,98 @@
 """Core print logic."""
 
-import json
 import logging
-from copy import copy
+from functools import cache, lru_cache
 
-import dotted
 from beartype import beartype
-from beartype.typing import Any, Dict, List, Optional
+from beartype.typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple, Union
 from corallium.loggers.rich_printer import rich_printer
 from corallium.loggers.styles import get_level
-from pydantic import BaseModel
 from rich.console import Console
 
 from ..config import Config
 
+try:
+    import orjson as _json  # Rust-based parser is significantly faster per-line
+except ImportError:  # pragma: no cover
+    import json as _json  # type: ignore[no-redef]
+
+_RESERVED_KEYS = frozenset({
+    'message', 'is_header', '_this_level', '_is_text', '_console', '_styles', '_keys_on_own_line', 'timestamp',
+})
+"""Keyword arguments to `rich_printer` that record data must not shadow."""
+
+
+@lru_cache(maxsize=32)
+def _get_level(name: str) -> int:
+    """Cache `get_level` because level names come from a tiny fixed vocabulary."""
+    return get_level(name=name)
+
+
+@cache
+def _split_dotted_key(key: str) -> Tuple[str, ...]:
+    """Split a dotted key into path segments, keeping double-quoted segments verbatim.
+
+    Cached so that configured keys are only parsed once per process rather than per line.
+
+    """
+    segments = []
+    chars: List[str] = []
+    in_quotes = False
+    for char in key:
+        if char == '"':
+            in_quotes = not in_quotes
+        elif char == '.' and not in_quotes:
+            segments.append(''.join(chars))
+            chars = []
+        else:
+            chars.append(char)
+    segments.append(''.join(chars))
+    return tuple(segments)
+
+
+def _list_index(node: List, segment: str) -> Optional[int]:  # type: ignore[type-arg]
+    """Return the in-bounds list index for an int-like path segment."""
+    if segment.isdigit() and (index := int(segment)) < len(node):
+        return index
+    return None
+
 
-@beartype
 def _dot_pop(data: Dict, key: str) -> Optional[str]:  # type: ignore[type-arg]
-    value = dotted.get(data, key)
-    if isinstance(value, str):
-        dotted.remove(data, key)
+    path = _split_dotted_key(key)
+    node: Any = data
+    if len(path) > 1:  # Plain (single-segment) keys skip the descent entirely
+        for segment in path[:-1]:
+            if isinstance(node, dict):
+                node = node.get(segment)
+            elif isinstance(node, list) and (index := _list_index(node, segment)) is not None:
+                node = node[index]
+            else:
+                return None
+            if node is None:
+                return None
+    leaf = path[-1]
+    if isinstance(node, dict) and isinstance(value := node.get(leaf), str):
+        del node[leaf]
+        return value or None
+    if (
+        isinstance(node, list)
+        and (index := _list_index(node, leaf)) is not None
+        and isinstance(value := node[index], str)
+    ):
+        del node[index]
         return value or None
     return None
 
 
-@beartype
-def _pop_key(data: Dict, keys: List[str], fallback: str) -> Any:  # type: ignore[type-arg]
-    """Recursively pop each key while searching for a match."""
-    try:
-        key = keys.pop(0)
-    except IndexError:
-        return fallback
-    else:
-        return _dot_pop(data, key) or _pop_key(data, keys, fallback)
-
-
-@beartype
 def pop_key(data: Dict, keys: List[str], fallback: str) -> Any:  # type: ignore[type-arg]
     """Safely find the first key in the data or default to the fallback."""
-    return _pop_key(data, copy(keys), fallback)
+    for key in keys:
+        if (value := _dot_pop(data, key)) is not None:
+            return value
+    return fallback
 
 
-class Record(BaseModel):
+class Record(NamedTuple):
     """Record Model."""
 
     timestamp: str
@@ -50,7 +101,6 @@ class Record(BaseModel):
     data: Dict  # type: ignore[type-arg]
 
     @classmethod
-    @beartype
     def from_line(cls, data: Dict, config: Config) -> 'Record':  # type: ignore[type-arg]
         """Extract Record from jsonl."""
         return cls(
@@ -62,30 +112,50 @@ class Record(BaseModel):
 
 
 @beartype
-def print_record(line: str, console: Console, config: Config) -> None:
+def build_printer(console: Console, config: Config) -> Callable[[Union[str, bytes]], None]:
+    """Bind config- and console-invariants once and return a per-line printer."""
+    styles = config.styles
+    keys_on_own_line = config.keys.on_own_line
+
+    def print_line(line: Union[str, bytes]) -> None:
+        record = None
+        if line.lstrip()[:1] in {'{', b'{'}:  # Cheap check to skip the parser for non-JSONL lines
+            try:
+                record = Record.from_line(_json.loads(line), config=config)
+            except Exception:
+                record = None
+        if record is None:
+            if isinstance(line, bytes):
+                line = line.decode('utf-8', errors='replace')
+            console.print(line.rstrip(), markup=False, highlight=False)  # Print the unmodified line
+            return
+
+        if (_this_level := _get_level(record.level)) == logging.NOTSET and record.level:
+            record.data['_level_name'] = record.level
+
+        printer_kwargs = {
+            'message': record.message,
+            'is_header': False,
+            '_this_level': _this_level,
+            '_is_text': False,
+            '_console': console,
+            '_styles': styles,
+            '_keys_on_own_line': keys_on_own_line,
+            'timestamp': record.timestamp,
+        }
+        if _RESERVED_KEYS.isdisjoint(record.data):
+            rich_printer(**printer_kwargs, **record.data)
+        else:
+            rich_printer(
+                **printer_kwargs,
+                # Ensure that there is no repeat keyword arguments
+                **{f'_{key}' if key in _RESERVED_KEYS else key: value for key, value in record.data.items()},
+            )
+
+    return print_line
+
+
+@beartype
+def print_record(line: Union[str, bytes], console: Console, config: Config) -> None:
     """Format and print the record."""
-    try:
-        record = Record.from_line(json.loads(line), config=config)
-    except Exception:
-        console.print(line.rstrip(), markup=False, highlight=False)  # Print the unmodified line
-        return
-
-    if (_this_level := get_level(name=record.level)) == logging.NOTSET and record.level:
-        record.data['_level_name'] = record.level
-
-    printer_kwargs = {
-        'message': record.message,
-        'is_header': False,
-        '_this_level': _this_level,
-        '_is_text': False,
-        '_console': console,
-        '_styles': config.styles,
-        '_keys_on_own_line': config.keys.on_own_line,
-        'timestamp': record.timestamp,
-    }
-    keys = set(printer_kwargs)
-    rich_printer(
-        **printer_kwargs,
-        # Ensure that there is no repeat keyword arguments
-        **{f'_{key}' if key in keys else key: value for key, value in record.data.items()},
-    )
+    build_printer(console, config)(line)
@@ -3,12 +3,14 @@
 
 from beartype.typing import List
 from corallium.loggers.styles import Styles
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class Keys(BaseModel):
     """Special Keys."""
 
+    model_config = ConfigDict(frozen=True)
+
     timestamp: List[str] = Field(default_factory=lambda: ['timestamp', 'record.time.repr'])
     level: List[str] = Field(default_factory=lambda: ['level', 'record.level.name'])
     message: List[str] = Field(default_factory=lambda: ['event', 'message', 'record.message'])
@@ -19,5 +21,7 @@ class Keys(BaseModel):
 class Config(BaseModel):
     """`tail-jsonl` config."""
 
+    model_config = ConfigDict(frozen=True)
+
     styles: Styles = Field(default_factory=Styles)
     keys: Keys = Field(default_factory=Keys)
@@ -1,17 +1,12 @@
 """Start the command line program."""
 
-import argparse
-import fileinput
 import sys
 from pathlib import Path
 
 from beartype import beartype
 from beartype.typing import Dict, Optional
-from corallium.tomllib import tomllib
-from rich.console import Console
 
 from . import __version__
-from ._private.core import print_record
 from .config import Config
 
 
@@ -20,7 +15,10 @@ def _load_config(config_path: Optional[str]) -> Config:
     """Load specified configuration file."""
     user_config: Dict = {}  # type: ignore[type-arg]
     if config_path:
-        user_config = tomllib.loads(Path(config_path).read_text(encoding='utf-8'))
+        from corallium.tomllib import tomllib  # noqa: PLC0415
+
+        with Path(config_path).open('rb') as toml_file:
+            user_config = tomllib.load(toml_file)
     return Config(**user_config)
 
 
@@ -28,6 +26,7 @@ def _load_config(config_path: Optional[str]) -> Config:
 def start() -> None:  # pragma: no cover
     """CLI Entrypoint."""
     # PLANNED: Add a flag (--debug & store_true) to print debugging information
+    import argparse  # noqa: PLC0415
 
     parser = argparse.ArgumentParser(description='Pipe JSONL Logs for pretty printing')
     parser.add_argument(
@@ -36,9 +35,14 @@ def start() -> None:  # pragma: no cover
     )
     parser.add_argument('--config-path', help='Path to a configuration file')
     options = parser.parse_args(sys.argv[1:])
-    sys.argv = sys.argv[:1]  # Remove CLI before calling fileinput
+
+    # Imported lazily so `--help` and `--version` do not pay for Rich
+    from rich.console import Console  # noqa: PLC0415
+
+    from ._private.core import build_printer  # noqa: PLC0415
 
     config = _load_config(options.config_path)
-    console = Console()
-    for line in fileinput.input():
-        print_record(line, console, config)
+    print_line = build_printer(Console(), config)
+    # Read stdin as buffered bytes so JSON lines are parsed without a text-mode decode
+    for line in sys.stdin.buffer:
+        print_line(line)
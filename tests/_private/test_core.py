@@ -26,28 +26,32 @@ import json
 import platform
 
 import pytest
-from beartype import beartype
 from beartype.typing import List
 from rich.console import Console
 
 from tail_jsonl._private.core import print_record
-from tail_jsonl.config import Config
+from tail_jsonl.config import Config, Keys
 
 from ..configuration import TEST_DATA_DIR
 
 
-@beartype
-def read_logs() -> List[str]:
-    return (TEST_DATA_DIR / 'logs.jsonl').read_text(encoding='utf-8').strip().split('\n')
+def read_logs() -> List[bytes]:
+    return (TEST_DATA_DIR / 'logs.jsonl').read_bytes().splitlines()
 
 
 LOGS = read_logs()
 
+WRAP_LINE = json.dumps({key: '-' * 3 for key in range(3)})
+"""Wide record encoded once at collection time for the wrap test."""
 
-@pytest.mark.parametrize('logs_index', [*range(len(LOGS))])
+DEFAULT_CONFIG = Config()
+"""Shared default Config; the model is frozen, so reuse across tests is safe."""
+
+
+@pytest.mark.parametrize('logs_index', range(len(LOGS)))
 def test_core(logs_index, snapshot, console: Console):
     """Smoketest core."""
-    print_record(LOGS[logs_index], console, Config())
+    print_record(LOGS[logs_index], console, DEFAULT_CONFIG)
 
     result = console.end_capture()
 
@@ -58,7 +62,7 @@ def test_core(logs_index, snapshot, console: Console):
 
 
 def test_core_no_key_matches(console: Console):
-    print_record('{"key": null}', console, Config())
+    print_record('{"key": null}', console, DEFAULT_CONFIG)
 
     result = console.end_capture()
 
@@ -66,15 +70,24 @@ def test_core_no_key_matches(console: Console):
 
 
 def test_core_bad_json(console: Console):
-    print_record('{"bad json": None}', console, Config())
+    print_record('{"bad json": None}', console, DEFAULT_CONFIG)
 
     result = console.end_capture()
 
     assert result.strip() == '{"bad json": None}'
 
 
+def test_core_list_index_key(console: Console):
+    config = Config(keys=Keys(message=['errors.0']))
+    print_record('{"errors": ["only-error"]}', console, config)
+
+    result = console.end_capture()
+
+    assert result.strip() == '<no timestamp>               [NOTSET ] only-error errors=[]'
+
+
 def test_core_wrap(console: Console):
-    print_record(json.dumps({key: '-' * 3 for key in range(3)}), console, Config())
+    print_record(WRAP_LINE, console, DEFAULT_CONFIG)
 
     result = console.end_capture()
 
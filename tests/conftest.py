@@ -3,14 +3,12 @@
 from pathlib import Path
 
 import pytest
-from beartype import beartype
 from rich.console import Console
 
 from .configuration import TEST_TMP_CACHE, clear_test_cache
 
 
 @pytest.fixture()
-@beartype
 def fix_test_cache() -> Path:
     """Fixture to clear and return the test cache directory for use.
 
@@ -22,8 +20,15 @@ def fix_test_cache() -> Path:
     return TEST_TMP_CACHE
 
 
+@pytest.fixture(scope='session')
+def shared_console() -> Console:
+    """Single Console reused across tests; terminal detection only runs once."""
+    return Console(log_path=False, log_time=False, color_system=None)
+
+
 @pytest.fixture()
-def console():
-    console = Console(log_path=False, log_time=False, color_system=None)
-    console.begin_capture()
-    return console
+def console(shared_console: Console):
+    shared_console.begin_capture()
+    yield shared_console
+    if shared_console._buffer_index:  # noqa: SLF001 # Drain capture if the test did not
+        shared_console.end_capture()